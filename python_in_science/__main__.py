@@ -0,0 +1,130 @@
+import argparse
+import importlib
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+# tool name -> (module, help), modules are imported only when their tool runs,
+# so e.g. the word histogram never pays for numba, sympy or bokeh
+TOOLS = {
+    "histogram": ("ex01_histogram", "histogram of words in a text file"),
+    "ising": ("ex02_ising", "Ising model simulation"),
+    "decorator": ("ex03_decorator", "timing decorator demo"),
+    "ising-numba": ("ex04_numba", "Ising model simulation with numba"),
+    "webscraping": ("ex05_webscraping", "scrape popular tv shows"),
+    "selenium": ("ex06_selenium", "scrape youtube shorts with selenium"),
+    "de": ("ex07_de", "plot SIR model solutions"),
+    "sympy": ("ex08_sympy", "solve and plot harmonic oscillators"),
+    "bokeh": ("ex09_bokeh", "serve the SIR model dashboard"),
+    "sir-scan": ("ex10_sir_scan", "SIR parameter-space outbreak maps"),
+    "sir-stochastic": ("ex11_sir_stochastic", "stochastic SIR ensembles"),
+    "sir-network": ("ex12_sir_network", "SIR on a random contact network"),
+}
+
+
+def import_times(module: str) -> list[tuple[int, int, int, str]]:
+    # the same measurement as `python -X importtime`, in a fresh interpreter so
+    # modules already imported here do not hide their cost
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [str(Path(__file__).parent.parent), env.get("PYTHONPATH")])
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+
+    if result.returncode != 0:
+        # the traceback follows the importtime lines of whatever did import
+        tail = [
+            line
+            for line in result.stderr.splitlines()
+            if not line.startswith("import time:")
+        ][-5:]
+        raise RuntimeError(f"importing {module} failed:\n" + "\n".join(tail))
+
+    # lines look like "import time:       129 |      18517 |     certifi.core"
+    # with two spaces of indentation per nesting level
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        if not self_us.strip().isdigit():
+            continue
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        entries.append((int(self_us), int(cumulative_us), depth, name.strip()))
+
+    return entries
+
+
+def report_import_time(tool: str, top: int):
+    module = f"{__package__}.{TOOLS[tool][0]}"
+    entries = import_times(module)
+
+    idx = next(
+        (idx for idx, entry in enumerate(entries) if entry[3] == module),
+        None,
+    )
+    if idx is None:
+        raise RuntimeError(f"no import time reported for {module}")
+    _, total, depth, _ = entries[idx]
+
+    # importtime lists children right before their parent
+    children = []
+    for _, cumulative, child_depth, name in reversed(entries[:idx]):
+        if child_depth <= depth:
+            break
+        if child_depth == depth + 1:
+            children.append((cumulative, name))
+
+    print(f"{module}: {total / 1000:.1f} [ms]")
+    for cumulative, name in sorted(children, reverse=True)[:top]:
+        print(f"  {cumulative / 1000:8.1f} [ms]  {name}")
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(
+        prog=f"python -m {__package__}",
+        description="python in science tools",
+    )
+    subparsers = parser.add_subparsers(dest="tool", required=True)
+
+    for tool, (_, help) in TOOLS.items():
+        # options are parsed by the tool itself, after it has been imported
+        subparsers.add_parser(tool, help=help, add_help=False)
+
+    importtime = subparsers.add_parser(
+        "importtime", help="report import time of a tool, like -X importtime"
+    )
+    importtime.add_argument("name", choices=TOOLS, help="tool to measure")
+    importtime.add_argument(
+        "-n",
+        "--top",
+        type=int,
+        default=10,
+        help="number of slowest imports to show",
+    )
+
+    args, rest = parser.parse_known_args(argv)
+
+    if args.tool == "importtime":
+        if rest:
+            parser.error(f"unrecognized arguments: {' '.join(rest)}")
+        try:
+            report_import_time(args.name, args.top)
+        except RuntimeError as error:
+            parser.error(str(error))
+        return
+
+    module = importlib.import_module(f"{__package__}.{TOOLS[args.tool][0]}")
+    # so the tool's usage reads "python -m python_in_science <tool>"
+    sys.argv = [f"{parser.prog} {args.tool}", *rest]
+    module.main(rest)
+
+
+if __name__ == "__main__":
+    main()
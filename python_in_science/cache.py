@@ -0,0 +1,25 @@
+import os
+import tempfile
+from pathlib import Path
+from typing import BinaryIO, Callable
+
+CACHE_ROOT = Path(
+    os.environ.get(
+        "PYTHON_IN_SCIENCE_CACHE",
+        Path.home() / ".cache" / "python_in_science",
+    )
+)
+
+
+def atomic_write(path: Path, dump: Callable[[BinaryIO], None]):
+    # write to a temporary file and rename, so concurrent readers never see a
+    # partially written entry
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            dump(file)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
@@ -62,7 +62,7 @@ class Ising:
                 yield step, self.magnet / self.n, self.lattice.copy()
 
 
-if __name__ == "__main__":
+def main(argv: list[str] | None = None):
     parser = argparse.ArgumentParser(description="run Ising simulation")
     parser.add_argument(
         "--size",
@@ -115,7 +115,7 @@ if __name__ == "__main__":
         type=str,
         help="output stats file name",
     )
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     ising = Ising(
         size=args.size,
@@ -177,3 +177,7 @@ if __name__ == "__main__":
             duration=40,
             loop=0,
         )
+
+
+if __name__ == "__main__":
+    main()
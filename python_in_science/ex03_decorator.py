@@ -1,3 +1,4 @@
+import argparse
 import json
 import random
 import statistics
@@ -71,8 +72,15 @@ def do_something(n: int) -> int:
     return x
 
 
-if __name__ == "__main__":
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="time a function with TimeIt")
+    parser.parse_args(argv)
+
     for _ in tqdm.tqdm(range(10), ascii=True):
         do_something(40000)
 
     do_something.print_stats()  # type: ignore
+
+
+if __name__ == "__main__":
+    main()
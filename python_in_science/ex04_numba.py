@@ -40,7 +40,7 @@ def ising(*, size, steps, beta, J, B):
     return magnets, states
 
 
-if __name__ == "__main__":
+def main(argv: list[str] | None = None):
     parser = argparse.ArgumentParser(description="Ising Simulation")
     parser.add_argument("--size", type=int, required=True)
     parser.add_argument("--beta", type=float, required=True)
@@ -50,7 +50,7 @@ if __name__ == "__main__":
     parser.add_argument("--output-images", type=str)
     parser.add_argument("--output-animation", type=str)
     parser.add_argument("--output-stats", type=str)
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     start = time.perf_counter()
     M, states = ising(
@@ -108,3 +108,7 @@ if __name__ == "__main__":
         with open(args.output_stats, "w") as f:
             for step, magnet in enumerate(M):
                 f.write(f"{step},{magnet}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,31 +1,14 @@
 import argparse
 import json
+import sys
 from dataclasses import dataclass
 from typing import Optional
 
 import requests
-from ascii_graph import sys
 from bs4 import BeautifulSoup, ResultSet
 
-parser = argparse.ArgumentParser(description="sum the integers at the command line")
-parser.add_argument(
-    "file",
-    nargs="?",
-    default=sys.stdout,
-    type=argparse.FileType("w"),
-    help="path to file",
-)
-args = parser.parse_args()
-
 URL = "https://www.rottentomatoes.com"
 
-best_tv_shows = requests.get(URL + "/browse/tv_series_browse/sort:popular")
-
-soup = BeautifulSoup(best_tv_shows.text, "html.parser")
-shows: ResultSet[BeautifulSoup] = soup.find_all(
-    "a", attrs={"data-qa": "discovery-media-list-item-caption"}
-)
-
 
 @dataclass
 class Show:
@@ -42,22 +25,46 @@ class Show:
         return None
 
 
-output = []
-
-for show in shows:
-    title = show.find("span", attrs={"data-qa": "discovery-media-list-item-title"})
-    critics_score = show.find("rt-text", attrs={"slot": "criticsScore"})
-    audience_score = show.find("rt-text", attrs={"slot": "audienceScore"})
-    url = URL + show.attrs["href"]
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(
+        description="scrape popular tv shows from rotten tomatoes"
+    )
+    parser.add_argument(
+        "file",
+        nargs="?",
+        default=sys.stdout,
+        type=argparse.FileType("w"),
+        help="path to file",
+    )
+    args = parser.parse_args(argv)
 
-    assert title and url and critics_score and audience_score
+    best_tv_shows = requests.get(URL + "/browse/tv_series_browse/sort:popular")
 
-    show = Show(
-        title=title.text.strip(),
-        url=url,
-        critics_score=Show.parse_score(critics_score.text),
-        audience_score=Show.parse_score(audience_score.text),
+    soup = BeautifulSoup(best_tv_shows.text, "html.parser")
+    shows: ResultSet[BeautifulSoup] = soup.find_all(
+        "a", attrs={"data-qa": "discovery-media-list-item-caption"}
     )
-    output.append(show.__dict__)
 
-json.dump(output, args.file)
+    output = []
+
+    for show in shows:
+        title = show.find("span", attrs={"data-qa": "discovery-media-list-item-title"})
+        critics_score = show.find("rt-text", attrs={"slot": "criticsScore"})
+        audience_score = show.find("rt-text", attrs={"slot": "audienceScore"})
+        url = URL + show.attrs["href"]
+
+        assert title and url and critics_score and audience_score
+
+        show = Show(
+            title=title.text.strip(),
+            url=url,
+            critics_score=Show.parse_score(critics_score.text),
+            audience_score=Show.parse_score(audience_score.text),
+        )
+        output.append(show.__dict__)
+
+    json.dump(output, args.file)
+
+
+if __name__ == "__main__":
+    main()
@@ -15,72 +15,77 @@ from selenium.webdriver.support.wait import WebDriverWait
 from webdriver_manager.chrome import ChromeDriverManager
 from webdriver_manager.core.os_manager import ChromeType
 
-parser = argparse.ArgumentParser(description="view top 10 shorts on youtube")
-parser.add_argument(
-    "file",
-    nargs="?",
-    default=sys.stdout,
-    type=argparse.FileType("w"),
-    help="path to file",
-)
-args = parser.parse_args()
 
-chrome_options = webdriver.ChromeOptions()
-chrome_options.add_argument("--mute-audio")
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="view top 10 shorts on youtube")
+    parser.add_argument(
+        "file",
+        nargs="?",
+        default=sys.stdout,
+        type=argparse.FileType("w"),
+        help="path to file",
+    )
+    args = parser.parse_args(argv)
 
-driver = webdriver.Chrome(
-    service=ChromiumService(
-        ChromeDriverManager(chrome_type=ChromeType.CHROMIUM).install()
-    ),
-    options=chrome_options,
-)
-wait = WebDriverWait(driver, timeout=10)
+    chrome_options = webdriver.ChromeOptions()
+    chrome_options.add_argument("--mute-audio")
 
-driver.get("https://youtube.com/shorts")
+    driver = webdriver.Chrome(
+        service=ChromiumService(
+            ChromeDriverManager(chrome_type=ChromeType.CHROMIUM).install()
+        ),
+        options=chrome_options,
+    )
+    wait = WebDriverWait(driver, timeout=10)
 
-spans = driver.find_elements(By.TAG_NAME, "span")
-for span in spans:
-    if span.get_attribute("innerText") == "Reject all":
-        span.click()
-        break
+    driver.get("https://youtube.com/shorts")
 
-videos = []
+    spans = driver.find_elements(By.TAG_NAME, "span")
+    for span in spans:
+        if span.get_attribute("innerText") == "Reject all":
+            span.click()
+            break
 
-for idx in range(4):
-    print(idx)
-    try:
-        short = wait.until(EC.visibility_of_element_located((By.ID, f"{idx}")))
-        driver.execute_script("arguments[0].scrollIntoView();", short)
+    videos = []
 
-        time.sleep(4)
+    for idx in range(4):
+        print(idx)
+        try:
+            short = wait.until(EC.visibility_of_element_located((By.ID, f"{idx}")))
+            driver.execute_script("arguments[0].scrollIntoView();", short)
 
-        channel = short.find_element(
-            By.CLASS_NAME,
-            "YtReelChannelBarViewModelChannelName",
-        )
-        title = short.find_element(
-            By.CLASS_NAME,
-            "YtShortsVideoTitleViewModelHost",
-        )
-        music = short.find_element(
-            By.CLASS_NAME,
-            "ytReelSoundMetadataViewModelMarqueeContainer",
-        )
+            time.sleep(4)
+
+            channel = short.find_element(
+                By.CLASS_NAME,
+                "YtReelChannelBarViewModelChannelName",
+            )
+            title = short.find_element(
+                By.CLASS_NAME,
+                "YtShortsVideoTitleViewModelHost",
+            )
+            music = short.find_element(
+                By.CLASS_NAME,
+                "ytReelSoundMetadataViewModelMarqueeContainer",
+            )
 
-    except StaleElementReferenceException:
-        continue
-    except NoSuchElementException:
-        continue
+        except StaleElementReferenceException:
+            continue
+        except NoSuchElementException:
+            continue
 
-    videos.append(
-        dict(
-            channel=channel.get_attribute("textContent"),
-            title=title.get_attribute("textContent"),
-            music=music.get_attribute("textContent") if music else None,
+        videos.append(
+            dict(
+                channel=channel.get_attribute("textContent"),
+                title=title.get_attribute("textContent"),
+                music=music.get_attribute("textContent") if music else None,
+            )
         )
-    )
 
+    driver.quit()
+
+    json.dump(videos, args.file, ensure_ascii=False)
 
-driver.quit()
 
-json.dump(videos, args.file, ensure_ascii=False)
+if __name__ == "__main__":
+    main()
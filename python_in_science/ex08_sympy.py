@@ -1,9 +1,13 @@
+import argparse
+import time as timer
 from pathlib import Path
 
 import matplotlib.pyplot as plt
 import numpy as np
 import sympy as sp
 
+from python_in_science.sympy_cache import cached_dsolve
+
 m, t, omega, omega0 = sp.symbols("m t omega omega0", positive=True, real=True)
 gamma, F0 = sp.symbols("gamma F0", real=True)
 
@@ -14,106 +18,144 @@ damped_eq = sp.Eq(
     x.diff(t, t) + 2 * gamma * x.diff(t) + omega0 * omega0 * x,
     0,
 )
-sp.pprint(damped_eq)
-sp.pprint(sp.dsolve(damped_eq, x))
 
 # x'' + omega0 * omega0 * x = 1/m * F0 * cos(omega * t)
 forced_eq = sp.Eq(
     x.diff(t, t) + omega0 * omega0 * x,
     F0 * sp.cos(omega * t) / m,
 )
-sp.pprint(forced_eq)
-sp.pprint(sp.dsolve(forced_eq, x))
 
 # x'' + 2 * gamma * x' + omega0^2 * x = F0/m * cos(omega * t)
 damped_forced_eq = sp.Eq(
     x.diff(t, t) + 2 * gamma * x.diff(t) + omega0 * omega0 * x,
     F0 * sp.cos(omega * t) / m,
 )
-sp.pprint(damped_forced_eq)
-damped_forced_sol = sp.dsolve(
-    damped_forced_eq, x, ics={x.subs(t, 0): 1, x.diff(t).subs(t, 0): 0}
-)
-sp.pprint(damped_forced_sol)
 
 ics = {x.subs(t, 0): 1, x.diff(t).subs(t, 0): 0}
 consts = {m: 1, omega0: 0.9, F0: 2}
 
-damped_func = [
-    (
-        gamma_val,
-        sp.lambdify(
-            t,
-            sp.dsolve(damped_eq, x, ics=ics).subs(consts).subs({gamma: gamma_val}).rhs,
-            "numpy",
-        ),
+
+def lambdify_params(sol: sp.Eq, params: tuple[sp.Symbol, ...]):
+    func = sp.lambdify((t, *params), sol.rhs.subs(consts), "numpy")
+
+    # sqrt(gamma**2 - omega0**2) is imaginary for an underdamped oscillator, so
+    # evaluate in complex arithmetic, the solution itself is real
+    def wrapper(t_vals, *param_vals):
+        param_vals = [np.asarray(val, dtype=complex) for val in param_vals]
+        return np.real(func(t_vals, *param_vals))
+
+    return wrapper
+
+
+def benchmark(damped_forced_sol: sp.Eq, damped_forced_func):
+    # compare lambdify against cse + numba kernels over many time points, numba
+    # is imported here so that plain runs do not pay for it
+    from python_in_science.sympy_kernels import numba_kernel
+
+    damped_forced_kernel = numba_kernel(
+        damped_forced_sol.rhs.subs(consts), t, (gamma, omega), complex_eval=True
     )
-    for gamma_val in [0.5, 0.25, 0.1]
-]
-
-forced_func = [
-    (
-        omega_val,
-        sp.lambdify(
-            t,
-            sp.dsolve(forced_eq, x, ics=ics).subs(consts).subs({omega: omega_val}).rhs,
-            "numpy",
-        ),
+
+    bench_time = np.linspace(0, 20, 1_000_000)
+    bench_gamma = np.linspace(0.05, 0.5, 10)
+    bench_omega = np.full_like(bench_gamma, 1.5)
+
+    damped_forced_kernel(bench_time[:1], bench_gamma[:1], bench_omega[:1])
+
+    start = timer.perf_counter()
+    lambdify_x = damped_forced_func(
+        bench_time, bench_gamma[:, None], bench_omega[:, None]
     )
-    for omega_val in [1.0, 1.5, 2.0]
-]
-
-damped_forced_func = [
-    (
-        (gamma_val, omega_val),
-        sp.lambdify(
-            t,
-            damped_forced_sol.subs(consts)
-            .subs({gamma: gamma_val, omega: omega_val})
-            .rhs,
-            "numpy",
-        ),
+    end = timer.perf_counter()
+    print(f"lambdify, time elapsed: {end - start} [s]")
+
+    start = timer.perf_counter()
+    kernel_x = damped_forced_kernel(bench_time, bench_gamma, bench_omega)
+    end = timer.perf_counter()
+    print(f"numba kernel, time elapsed: {end - start} [s]")
+
+    assert np.allclose(lambdify_x, kernel_x)
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="solve and plot harmonic oscillators")
+    parser.add_argument(
+        "--benchmark",
+        action="store_true",
+        help="compare lambdify against the numba kernel on 10 x 1e6 points",
     )
-    for gamma_val, omega_val in [(0.5, 1.0), (0.25, 1.5), (0.1, 2.0)]
-]
+    args = parser.parse_args(argv)
+
+    sp.pprint(damped_eq)
+    sp.pprint(cached_dsolve(damped_eq, x))
+    sp.pprint(forced_eq)
+    sp.pprint(cached_dsolve(forced_eq, x))
+    sp.pprint(damped_forced_eq)
+
+    # solve once with gamma and omega kept symbolic
+    damped_sol = cached_dsolve(damped_eq, x, ics=ics)
+    forced_sol = cached_dsolve(forced_eq, x, ics=ics)
+    damped_forced_sol = cached_dsolve(damped_forced_eq, x, ics=ics)
+    sp.pprint(damped_forced_sol)
 
-fig, [ax_d, ax_f, ax_df] = plt.subplots(nrows=3, figsize=(8, 12))
-time = np.linspace(0, 20, 1000)
+    # each function broadcasts over arrays of t and parameter values
+    damped_func = lambdify_params(damped_sol, (gamma,))
+    forced_func = lambdify_params(forced_sol, (omega,))
+    damped_forced_func = lambdify_params(damped_forced_sol, (gamma, omega))
 
-ax_d.set_title("Damped Harmonic Oscillator")
-ax_d.set_xlabel("Time (t)")
-ax_d.set_ylabel("Displacement (x)")
+    damped_params = np.array([0.5, 0.25, 0.1])
+    forced_params = np.array([1.0, 1.5, 2.0])
+    damped_forced_params = np.array([(0.5, 1.0), (0.25, 1.5), (0.1, 2.0)])
 
-for gamma_val, func in damped_func:
-    ax_d.plot(time, func(time), label=f"$\\gamma = {gamma_val}$")
+    fig, [ax_d, ax_f, ax_df] = plt.subplots(nrows=3, figsize=(8, 12))
+    time = np.linspace(0, 20, 1000)
 
-ax_d.legend()
-ax_d.grid()
+    ax_d.set_title("Damped Harmonic Oscillator")
+    ax_d.set_xlabel("Time (t)")
+    ax_d.set_ylabel("Displacement (x)")
 
-ax_f.set_title("Forced Harmonic Oscillator")
-ax_f.set_xlabel("Time (t)")
-ax_f.set_ylabel("Displacement (x)")
+    damped_x = damped_func(time, damped_params[:, None])
+    for gamma_val, x_vals in zip(damped_params, damped_x):
+        ax_d.plot(time, x_vals, label=f"$\\gamma = {gamma_val}$")
 
-for omega_val, func in forced_func:
-    ax_f.plot(time, func(time), label=f"$\\omega = {omega_val}$")
+    ax_d.legend()
+    ax_d.grid()
 
-ax_f.legend()
-ax_f.grid()
+    ax_f.set_title("Forced Harmonic Oscillator")
+    ax_f.set_xlabel("Time (t)")
+    ax_f.set_ylabel("Displacement (x)")
 
-ax_df.set_title("Damped + Forced Harmonic Oscillator")
-ax_df.set_xlabel("Time (t)")
-ax_df.set_ylabel("Displacement (x)")
+    forced_x = forced_func(time, forced_params[:, None])
+    for omega_val, x_vals in zip(forced_params, forced_x):
+        ax_f.plot(time, x_vals, label=f"$\\omega = {omega_val}$")
 
-for (gamma_val, omega_val), func in damped_forced_func:
-    ax_df.plot(
-        time,
-        func(time),
-        label=f"$\\gamma = {gamma_val}, \\omega = {omega_val}$",
+    ax_f.legend()
+    ax_f.grid()
+
+    ax_df.set_title("Damped + Forced Harmonic Oscillator")
+    ax_df.set_xlabel("Time (t)")
+    ax_df.set_ylabel("Displacement (x)")
+
+    damped_forced_x = damped_forced_func(
+        time, damped_forced_params[:, :1], damped_forced_params[:, 1:]
     )
+    for (gamma_val, omega_val), x_vals in zip(damped_forced_params, damped_forced_x):
+        ax_df.plot(
+            time,
+            x_vals,
+            label=f"$\\gamma = {gamma_val}, \\omega = {omega_val}$",
+        )
+
+    ax_df.legend()
+    ax_df.grid()
+
+    fig.tight_layout()
+    fig.savefig(Path(__file__).with_suffix(".pdf"))
+    # plt.show()
+
+    if args.benchmark:
+        benchmark(damped_forced_sol, damped_forced_func)
 
-ax_df.legend()
-ax_df.grid()
 
-fig.tight_layout()
-fig.savefig(Path(__file__).with_suffix(".pdf"))
-# plt.show()
+if __name__ == "__main__":
+    main()
@@ -1,95 +1,109 @@
+import argparse
+
 import numpy as np
-from bokeh.io import curdoc, show
+from bokeh.io import curdoc
 from bokeh.layouts import column, row
 from bokeh.models import ColumnDataSource, Slider
 from bokeh.plotting import figure
-from scipy.integrate import odeint
-
-
-def sir(y, t, beta, gamma):
-    S, I, R = y
-    dS_dt = -beta * S * I
-    dI_dt = beta * S * I - gamma * I
-    dR_dt = gamma * I
-    return [dS_dt, dI_dt, dR_dt]
-
-
-N = 1.0
-I0 = 0.01
-S0 = N - I0
-R0 = 0.0
-y0 = [S0, I0, R0]
-
-t = np.linspace(0, 100, 1000)
-
-source = ColumnDataSource(data=dict(t=[], S=[], I=[], R=[]))
-
-p = figure(
-    width=1280,
-    height=720,
-    title="SIR Model Simulation",
-    x_axis_label="Time",
-    y_axis_label="Population Proportion",
-)
-
-p.line(
-    "t",
-    "S",
-    line_color="blue",
-    line_width=2,
-    legend_label="Susceptible",
-    source=source,
-)
-p.line(
-    "t",
-    "I",
-    line_color="red",
-    line_width=2,
-    legend_label="Infected",
-    source=source,
-)
-p.line(
-    "t",
-    "R",
-    line_color="green",
-    line_width=2,
-    legend_label="Recovered",
-    source=source,
-)
-
-beta_slider = Slider(
-    title=r"$$\beta$$ (Infection Rate)",
-    value=0.3,
-    start=0.1,
-    end=1.0,
-    step=0.01,
-)
-
-gamma_slider = Slider(
-    title=r"$$\gamma$$ (Recovery Rate)",
-    value=0.1,
-    start=0.01,
-    end=0.5,
-    step=0.01,
-)
-
-
-def update_data(attrname, old, new):
-    beta = beta_slider.value
-    gamma = gamma_slider.value
-
-    solution = odeint(sir, y0, t, args=(beta, gamma))
-    S, I, R = solution.T
-
-    source.data = dict(t=t, S=S, I=I, R=R)
-
-
-beta_slider.on_change("value", update_data)
-gamma_slider.on_change("value", update_data)
-update_data("value", None, None)
-
-inputs = column(beta_slider, gamma_slider)
-layout = column(row(inputs, p))
-
-curdoc().add_root(layout)
-show(layout)
+from bokeh.server.server import Server
+
+from python_in_science.ex09_sir_solver import STEP, precompute, solve, t
+
+
+def make_document(doc):
+    empty = np.zeros_like(t, dtype=np.float32)
+    source = ColumnDataSource(
+        data=dict(t=t.astype(np.float32), S=empty, I=empty, R=empty)
+    )
+
+    p = figure(
+        width=1280,
+        height=720,
+        title="SIR Model Simulation",
+        x_axis_label="Time",
+        y_axis_label="Population Proportion",
+    )
+
+    p.line(
+        "t",
+        "S",
+        line_color="blue",
+        line_width=2,
+        legend_label="Susceptible",
+        source=source,
+    )
+    p.line(
+        "t",
+        "I",
+        line_color="red",
+        line_width=2,
+        legend_label="Infected",
+        source=source,
+    )
+    p.line(
+        "t",
+        "R",
+        line_color="green",
+        line_width=2,
+        legend_label="Recovered",
+        source=source,
+    )
+
+    beta_slider = Slider(
+        title=r"$$\beta$$ (Infection Rate)",
+        value=0.3,
+        start=0.1,
+        end=1.0,
+        step=STEP,
+    )
+
+    gamma_slider = Slider(
+        title=r"$$\gamma$$ (Recovery Rate)",
+        value=0.1,
+        start=0.01,
+        end=0.5,
+        step=STEP,
+    )
+
+    def update_data(attrname, old, new):
+        beta = beta_slider.value_throttled
+        gamma = gamma_slider.value_throttled
+
+        S, I, R = solve(beta, gamma)
+
+        # t never changes, so only the S, I, R columns are sent to the browser
+        source.data.update(S=S, I=I, R=R)
+
+    beta_slider.on_change("value_throttled", update_data)
+    gamma_slider.on_change("value_throttled", update_data)
+    update_data("value_throttled", None, None)
+
+    precompute(
+        np.arange(beta_slider.start, beta_slider.end + STEP / 2, STEP),
+        np.arange(gamma_slider.start, gamma_slider.end + STEP / 2, STEP),
+        center=(beta_slider.value, gamma_slider.value),
+    )
+
+    inputs = column(beta_slider, gamma_slider)
+    layout = column(row(inputs, p))
+
+    doc.add_root(layout)
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="serve the SIR model dashboard")
+    parser.add_argument("--port", type=int, default=5006)
+    args = parser.parse_args(argv)
+
+    server = Server({"/": make_document}, port=args.port)
+    server.start()
+    server.io_loop.add_callback(server.show, "/")
+    server.io_loop.start()
+
+
+# `bokeh serve ex09_bokeh.py` runs this file as a module named bokeh_app_<id>
+if __name__.startswith("bokeh_app_"):
+    make_document(curdoc())
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+import threading
+from functools import lru_cache
+
+import numpy as np
+
+from python_in_science.ode_cache import cached_odeint
+
+# shared by every bokeh session in the server process, unlike the app module
+# itself which is re-executed for each session
+
+STEP = 0.01
+CACHE_SIZE = 8192
+
+
+def sir(y, t, beta, gamma):
+    S, I, R = y
+    dS_dt = -beta * S * I
+    dI_dt = beta * S * I - gamma * I
+    dR_dt = gamma * I
+    return [dS_dt, dI_dt, dR_dt]
+
+
+N = 1.0
+I0 = 0.01
+S0 = N - I0
+R0 = 0.0
+y0 = [S0, I0, R0]
+
+t = np.linspace(0, 100, 1000)
+
+
+def quantize(value: float) -> int:
+    return round(value / STEP)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _solve(beta_idx: int, gamma_idx: int) -> np.ndarray:
+    solution = cached_odeint(sir, y0, t, args=(beta_idx * STEP, gamma_idx * STEP))
+    solution = solution.T.astype(np.float32)
+    solution.flags.writeable = False
+    return solution
+
+
+# rows S, I, R as float32, read-only since the arrays are shared between sessions
+def solve(beta: float, gamma: float) -> np.ndarray:
+    return _solve(quantize(beta), quantize(gamma))
+
+
+_precomputed = set()
+_lock = threading.Lock()
+
+
+# fill the cache with the slider grid in the background, nearest to `center` first
+def precompute(betas: np.ndarray, gammas: np.ndarray, center: tuple[float, float]):
+    keys = {(quantize(beta), quantize(gamma)) for beta in betas for gamma in gammas}
+
+    with _lock:
+        keys -= _precomputed
+        _precomputed.update(keys)
+
+    beta_idx, gamma_idx = quantize(center[0]), quantize(center[1])
+    keys = sorted(keys, key=lambda k: abs(k[0] - beta_idx) + abs(k[1] - gamma_idx))
+
+    def worker():
+        for key in keys:
+            _solve(*key)
+
+    threading.Thread(target=worker, name="sir-precompute", daemon=True).start()
@@ -0,0 +1,126 @@
+import argparse
+import time
+from pathlib import Path
+
+import numba
+import numpy as np
+import scienceplots
+from matplotlib import pyplot as plt
+
+
+@numba.njit(inline="always")
+def sir_rhs(S, I, beta, gamma):
+    infection = beta * S * I
+    recovery = gamma * I
+    return -infection, infection - recovery
+
+
+@numba.njit(cache=True)
+def sir_metrics(beta, gamma, I0, t_max, dt):
+    # fixed-step RK4, R is implied by S + I + R = 1
+    S = 1.0 - I0
+    I = I0
+
+    peak_I = I
+    peak_t = 0.0
+
+    # dt is an upper bound, the step is shrunk so the last one lands on t_max
+    steps = int(np.ceil(t_max / dt))
+    h = t_max / steps
+    for step in range(1, steps + 1):
+        k1S, k1I = sir_rhs(S, I, beta, gamma)
+        k2S, k2I = sir_rhs(S + 0.5 * h * k1S, I + 0.5 * h * k1I, beta, gamma)
+        k3S, k3I = sir_rhs(S + 0.5 * h * k2S, I + 0.5 * h * k2I, beta, gamma)
+        k4S, k4I = sir_rhs(S + h * k3S, I + h * k3I, beta, gamma)
+
+        S += h / 6.0 * (k1S + 2.0 * k2S + 2.0 * k3S + k4S)
+        I += h / 6.0 * (k1I + 2.0 * k2I + 2.0 * k3I + k4I)
+
+        if I > peak_I:
+            peak_I = I
+            peak_t = step * h
+
+    return peak_I, peak_t, 1.0 - S
+
+
+@numba.njit(parallel=True, cache=True)
+def sir_scan(betas, gammas, I0s, t_max, dt):
+    nb, ng, ni = len(betas), len(gammas), len(I0s)
+
+    peak = np.empty((nb, ng, ni))
+    peak_time = np.empty((nb, ng, ni))
+    final_size = np.empty((nb, ng, ni))
+
+    for idx in numba.prange(nb * ng * ni):
+        b = idx // (ng * ni)
+        g = (idx // ni) % ng
+        i = idx % ni
+
+        peak[b, g, i], peak_time[b, g, i], final_size[b, g, i] = sir_metrics(
+            betas[b], gammas[g], I0s[i], t_max, dt
+        )
+
+    return peak, peak_time, final_size
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(
+        description="scan SIR parameter space and plot outbreak maps"
+    )
+    parser.add_argument("--beta", type=float, nargs=3, default=[0.1, 1.0, 500])
+    parser.add_argument("--gamma", type=float, nargs=3, default=[0.01, 0.5, 500])
+    parser.add_argument("--I0", type=float, nargs="+", default=[0.01])
+    parser.add_argument("--t-max", type=float, default=100.0)
+    parser.add_argument("--dt", type=float, default=0.1)
+    parser.add_argument("--output-arrays", type=str, help="output .npz file name")
+    args = parser.parse_args(argv)
+
+    if args.t_max <= 0:
+        parser.error("--t-max must be positive")
+    if args.dt <= 0:
+        parser.error("--dt must be positive")
+
+    betas = np.linspace(args.beta[0], args.beta[1], int(args.beta[2]))
+    gammas = np.linspace(args.gamma[0], args.gamma[1], int(args.gamma[2]))
+    I0s = np.array(args.I0)
+
+    start = time.perf_counter()
+    peak, peak_time, final_size = sir_scan(betas, gammas, I0s, args.t_max, args.dt)
+    end = time.perf_counter()
+
+    print(f"{peak.size} points, time elapsed: {end - start} [s]")
+
+    if args.output_arrays:
+        np.savez_compressed(
+            args.output_arrays,
+            beta=betas,
+            gamma=gammas,
+            I0=I0s,
+            peak=peak,
+            peak_time=peak_time,
+            final_size=final_size,
+        )
+
+    plt.style.use(["science", "ieee"])
+
+    fig, axs = plt.subplots(nrows=1, ncols=3, figsize=(15, 5))
+
+    extent = (gammas[0], gammas[-1], betas[0], betas[-1])
+    for ax, values, title in zip(
+        axs,
+        [peak[:, :, 0], peak_time[:, :, 0], final_size[:, :, 0]],
+        ["Peak Infection", "Time to Peak", "Final Size"],
+    ):
+        im = ax.imshow(values, origin="lower", aspect="auto", extent=extent)
+        fig.colorbar(im, ax=ax)
+
+        ax.set_title(f"{title}, $I_0={I0s[0]}$")
+        ax.set_xlabel("$\\gamma$")
+        ax.set_ylabel("$\\beta$")
+
+    plt.tight_layout()
+    plt.savefig(Path(__file__).stem + ".pdf")
+
+
+if __name__ == "__main__":
+    main()
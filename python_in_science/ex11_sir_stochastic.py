@@ -0,0 +1,184 @@
+import argparse
+import math
+import time
+from pathlib import Path
+
+import numba
+import numpy as np
+import scienceplots
+from matplotlib import pyplot as plt
+
+from python_in_science.ex09_sir_solver import sir
+from python_in_science.ode_cache import cached_odeint
+
+# states are sampled on the same time grid as the ODE solution, shape
+# (len(time), 3, runs) with rows S, I, R, so no individual events are kept
+
+QUANTILE_BLOCK = 64
+
+
+@numba.njit(parallel=True, cache=True)
+def _gillespie(N, I0, beta, gamma, time, seeds):
+    runs = len(seeds)
+    states = np.empty((len(time), 3, runs), dtype=np.int32)
+
+    for run in numba.prange(runs):
+        np.random.seed(seeds[run])
+
+        S, I, R = N - I0, I0, 0
+        now = 0.0
+        k = 0
+
+        while k < len(time):
+            infection = beta * S * I / N
+            recovery = gamma * I
+            total = infection + recovery
+
+            if total == 0.0:
+                next_event = math.inf
+            else:
+                next_event = now - math.log(1.0 - np.random.random()) / total
+
+            while k < len(time) and time[k] < next_event:
+                states[k, 0, run] = S
+                states[k, 1, run] = I
+                states[k, 2, run] = R
+                k += 1
+
+            if total == 0.0:
+                break
+
+            if np.random.random() * total < infection:
+                S -= 1
+                I += 1
+            else:
+                I -= 1
+                R += 1
+            now = next_event
+
+    return states
+
+
+def gillespie(*, N, I0, beta, gamma, time, runs, seed):
+    # one independent stream per run, seeds derived from the ensemble seed so
+    # that runs of different ensembles, e.g. --seed 0 and --seed 1, never share
+    seeds = np.random.SeedSequence(seed).generate_state(runs)
+    return _gillespie(N, I0, beta, gamma, time, seeds)
+
+
+def tau_leaping(*, N, I0, beta, gamma, time, runs, seed, tau):
+    rng = np.random.default_rng(seed)
+    states = np.empty((len(time), 3, runs), dtype=np.int32)
+
+    S = np.full(runs, N - I0, dtype=np.int64)
+    I = np.full(runs, I0, dtype=np.int64)
+    R = np.zeros(runs, dtype=np.int64)
+
+    states[0] = S, I, R
+
+    for k in range(1, len(time)):
+        steps = max(1, math.ceil((time[k] - time[k - 1]) / tau))
+        h = (time[k] - time[k - 1]) / steps
+        p_recovery = -np.expm1(-gamma * h)
+
+        for _ in range(steps):
+            # binomial draws keep every compartment non-negative
+            infected = rng.binomial(S, -np.expm1(-beta * I / N * h))
+            recovered = rng.binomial(I, p_recovery)
+            S -= infected
+            I += infected - recovered
+            R += recovered
+
+        states[k] = S, I, R
+
+    return states
+
+
+def quantiles(states: np.ndarray, q) -> np.ndarray:
+    # shape (len(q), len(time), 3), taken a block of time points at a time, as
+    # np.quantile copies its input and the whole ensemble can be ~100 MB
+    result = np.empty((len(q), *states.shape[:-1]))
+    for start in range(0, len(states), QUANTILE_BLOCK):
+        block = slice(start, start + QUANTILE_BLOCK)
+        result[:, block] = np.quantile(states[block], q, axis=-1)
+    return result
+
+
+def outbreak_probability(states: np.ndarray, N: int, threshold: float) -> float:
+    return float(np.mean(states[-1, 2] > threshold * N))
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="run stochastic SIR ensembles")
+    parser.add_argument("-N", type=int, default=1000, help="population size")
+    parser.add_argument("--I0", type=int, default=5, help="initially infected")
+    parser.add_argument("--beta", type=float, default=0.3)
+    parser.add_argument("--gamma", type=float, default=0.1)
+    parser.add_argument("--runs", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--method",
+        choices=["gillespie", "tau-leaping"],
+        default="gillespie",
+    )
+    parser.add_argument("--tau", type=float, default=0.05, help="tau-leaping step")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="final size fraction counted as an outbreak",
+    )
+    args = parser.parse_args(argv)
+
+    time_grid = np.linspace(0, 100, 1000)
+    kwargs = dict(
+        N=args.N,
+        I0=args.I0,
+        beta=args.beta,
+        gamma=args.gamma,
+        time=time_grid,
+        runs=args.runs,
+        seed=args.seed,
+    )
+
+    start = time.perf_counter()
+    if args.method == "gillespie":
+        states = gillespie(**kwargs)
+    else:
+        states = tau_leaping(**kwargs, tau=args.tau)
+    end = time.perf_counter()
+
+    print(f"{args.runs} runs, time elapsed: {end - start} [s]")
+    print(
+        "outbreak probability:",
+        outbreak_probability(states, args.N, args.threshold),
+    )
+
+    low, median, high = quantiles(states, [0.05, 0.5, 0.95]) / args.N
+    y0 = [(args.N - args.I0) / args.N, args.I0 / args.N, 0]
+    sol = cached_odeint(sir, y0, time_grid, args=(args.beta, args.gamma))
+
+    plt.style.use(["science", "ieee"])
+
+    fig, ax = plt.subplots(figsize=(8, 5))
+
+    for idx, (label, color) in enumerate(
+        zip(["Susceptible", "Infected", "Recovered"], ["blue", "red", "green"])
+    ):
+        ax.fill_between(
+            time_grid, low[:, idx], high[:, idx], color=color, alpha=0.2, lw=0
+        )
+        ax.plot(time_grid, median[:, idx], color=color, label=label)
+        ax.plot(time_grid, sol[:, idx], color=color, ls="--", lw=0.8)
+
+    ax.set_title(f"$\\beta={args.beta}$, $\\gamma={args.gamma}$, $N={args.N}$")
+    ax.set_xlabel("Time")
+    ax.set_ylabel("Population Proportion")
+    ax.legend()
+
+    plt.tight_layout()
+    plt.savefig(Path(__file__).stem + ".pdf")
+
+
+if __name__ == "__main__":
+    main()
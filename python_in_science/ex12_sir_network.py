@@ -0,0 +1,172 @@
+import argparse
+import time
+from pathlib import Path
+
+import numpy as np
+import scienceplots
+from matplotlib import pyplot as plt
+from scipy import sparse
+from scipy.integrate import RK45
+
+# the contact network is a CSR matrix A, so the infection pressure on every node
+# is a single sparse product A @ I and memory stays linear in the number of
+# edges; weighted A gives a metapopulation model with nodes as patches
+
+
+def random_network(n: int, mean_degree: float, seed: int = 0) -> sparse.csr_matrix:
+    rng = np.random.default_rng(seed)
+    m = int(n * mean_degree / 2)
+
+    i = rng.integers(0, n, size=m, dtype=np.int32)
+    j = rng.integers(0, n, size=m, dtype=np.int32)
+    keep = i != j
+    i, j = i[keep], j[keep]
+
+    A = sparse.coo_matrix(
+        (np.ones(2 * len(i), dtype=np.float32), (np.r_[i, j], np.r_[j, i])),
+        shape=(n, n),
+    ).tocsr()
+    # duplicate edges were summed, contacts are either there or not
+    A.data[:] = 1.0
+    return A
+
+
+def network_sir(t, y, A, beta, gamma):
+    n = A.shape[0]
+    S, I = y[:n], y[n:]
+    infection = beta * S * (A @ I)
+    return np.concatenate([-infection, infection - gamma * I])
+
+
+def mean_field(A, I0: np.ndarray, time_grid: np.ndarray, beta: float, gamma: float):
+    n = A.shape[0]
+    y0 = np.concatenate([1.0 - I0, I0])
+
+    # explicit RK45, implicit solvers would build an n x n jacobian; stepping
+    # the solver by hand instead of solve_ivp(t_eval=...) avoids keeping every
+    # node's trajectory, only the totals on the time grid are stored
+    solver = RK45(
+        lambda t, y: network_sir(t, y, A, beta, gamma),
+        time_grid[0],
+        y0,
+        time_grid[-1],
+    )
+
+    totals = np.empty((len(time_grid), 2))
+    totals[0] = y0[:n].sum(), y0[n:].sum()
+    k = 1
+
+    while k < len(time_grid):
+        solver.step()
+        if solver.status == "failed":
+            raise RuntimeError(f"mean-field integration failed at t={solver.t}")
+
+        if time_grid[k] <= solver.t:
+            dense = solver.dense_output()
+            while k < len(time_grid) and time_grid[k] <= solver.t:
+                y = dense(time_grid[k])
+                totals[k] = y[:n].sum(), y[n:].sum()
+                k += 1
+
+    S, I = totals.T / n
+    # shape (len(time), 3) like odeint
+    return np.stack([S, I, 1.0 - S - I], axis=1)
+
+
+SUSCEPTIBLE, INFECTED, RECOVERED = 0, 1, 2
+
+
+def stochastic(
+    A,
+    infected: np.ndarray,
+    time_grid: np.ndarray,
+    beta: float,
+    gamma: float,
+    seed: int = 0,
+):
+    rng = np.random.default_rng(seed)
+    n = A.shape[0]
+
+    state = np.full(n, SUSCEPTIBLE, dtype=np.int8)
+    state[infected] = INFECTED
+
+    counts = np.empty((len(time_grid), 3))
+    counts[0] = np.bincount(state, minlength=3)
+
+    for k in range(1, len(time_grid)):
+        dt = time_grid[k] - time_grid[k - 1]
+
+        is_infected = state == INFECTED
+        pressure = A @ is_infected.astype(np.float32)
+
+        p_infection = -np.expm1(-beta * dt * pressure)
+        p_recovery = -np.expm1(-gamma * dt)
+        draw = rng.random(n, dtype=np.float32)
+
+        state[(state == SUSCEPTIBLE) & (draw < p_infection)] = INFECTED
+        state[is_infected & (draw < p_recovery)] = RECOVERED
+
+        counts[k] = np.bincount(state, minlength=3)
+
+    return counts / n
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="run SIR on a random contact network")
+    parser.add_argument("-n", type=int, default=1_000_000, help="number of nodes")
+    parser.add_argument("-k", type=float, default=10, help="mean degree")
+    parser.add_argument("--beta", type=float, default=0.05)
+    parser.add_argument("--gamma", type=float, default=0.1)
+    parser.add_argument("--I0", type=float, default=0.001)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    A = random_network(args.n, args.k, seed=args.seed)
+    end = time.perf_counter()
+    print(f"{A.nnz // 2} edges, time elapsed: {end - start} [s]")
+
+    time_grid = np.linspace(0, 100, 1000)
+    rng = np.random.default_rng(args.seed)
+    infected = rng.random(args.n) < args.I0
+
+    start = time.perf_counter()
+    mean_field_sol = mean_field(
+        A, infected.astype(float), time_grid, args.beta, args.gamma
+    )
+    end = time.perf_counter()
+    print(f"mean-field, time elapsed: {end - start} [s]")
+
+    start = time.perf_counter()
+    stochastic_sol = stochastic(
+        A, infected, time_grid, args.beta, args.gamma, seed=args.seed
+    )
+    end = time.perf_counter()
+    print(f"stochastic, time elapsed: {end - start} [s]")
+
+    plt.style.use(["science", "ieee"])
+
+    fig, axs = plt.subplots(nrows=1, ncols=2, figsize=(10, 5), sharey=True)
+
+    for ax, sol, title in zip(
+        axs,
+        [mean_field_sol, stochastic_sol],
+        ["Mean-Field", "Stochastic"],
+    ):
+        S, I, R = sol.T
+
+        ax.plot(time_grid, S, label="Susceptible")
+        ax.plot(time_grid, I, label="Infected")
+        ax.plot(time_grid, R, label="Recovered")
+
+        ax.set_title(f"{title}, $n={args.n}$, $\\langle k \\rangle={args.k}$")
+        ax.set_xlabel("Time")
+        ax.set_ylabel("Population Proportion")
+        ax.legend()
+
+    plt.tight_layout()
+    plt.savefig(Path(__file__).stem + ".pdf")
+
+
+if __name__ == "__main__":
+    main()
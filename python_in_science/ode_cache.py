@@ -0,0 +1,165 @@
+import hashlib
+import os
+import types
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+from scipy.integrate import odeint
+
+from python_in_science.cache import CACHE_ROOT, atomic_write
+
+CACHE_DIR = CACHE_ROOT / "ode"
+MAX_BYTES = 512 * 1024 * 1024
+
+# bytes written by this process since the last eviction pass, None forces the
+# first write to check the whole directory
+_unchecked_bytes = None
+
+
+class UnhashableModel(Exception):
+    pass
+
+
+def _hash_value(digest, value, seen: set[int]):
+    # everything goes in by content, never by repr of an object that may embed
+    # a memory address, so keys are stable across processes
+    digest.update(type(value).__qualname__.encode())
+
+    if value is None or isinstance(value, (bool, int, float, complex, str)):
+        digest.update(repr(value).encode())
+    elif isinstance(value, bytes):
+        digest.update(value)
+    elif isinstance(value, np.ndarray):
+        if value.dtype.hasobject:
+            # the bytes of an object array are pointers
+            raise UnhashableModel("cannot hash object arrays by content")
+        digest.update(f"{value.dtype.str}{value.shape}".encode())
+        digest.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, (tuple, list, frozenset)):
+        if isinstance(value, frozenset):
+            value = sorted(value, key=repr)
+        digest.update(str(len(value)).encode())
+        for item in value:
+            _hash_value(digest, item, seen)
+    elif isinstance(value, types.ModuleType):
+        digest.update(value.__name__.encode())
+    elif isinstance(value, types.BuiltinFunctionType):
+        digest.update(f"{value.__module__}.{value.__qualname__}".encode())
+    elif isinstance(value, types.CodeType):
+        digest.update(value.co_code)
+        _hash_value(digest, value.co_consts, seen)
+        _hash_value(digest, value.co_names, seen)
+    elif isinstance(value, types.FunctionType):
+        # guards against recursive functions and mutually referencing globals
+        if id(value) in seen:
+            digest.update(b"<recursion>")
+            return
+        seen.add(id(value))
+
+        code = value.__code__
+        _hash_value(digest, code, seen)
+        _hash_value(digest, value.__defaults__, seen)
+        _hash_value(digest, sorted((value.__kwdefaults__ or {}).items()), seen)
+        _hash_value(
+            digest,
+            tuple(cell.cell_contents for cell in value.__closure__ or ()),
+            seen,
+        )
+        for name in sorted(_global_names(code)):
+            if name in value.__globals__:
+                digest.update(name.encode())
+                _hash_value(digest, value.__globals__[name], seen)
+    else:
+        raise UnhashableModel(f"cannot hash {type(value).__qualname__} by content")
+
+
+def _global_names(code: types.CodeType) -> set[str]:
+    # names used by nested code objects, e.g. a generator expression, resolve in
+    # the same globals as the function itself
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= _global_names(const)
+    return names
+
+
+def cache_key(func: Callable, y0, t, args: tuple) -> str:
+    # hash the bytecode rather than the source, so the same model defined in
+    # different scripts shares its cache entries; defaults, closure cells and
+    # referenced globals are part of the model too
+    digest = hashlib.sha256()
+    seen = set()
+    _hash_value(digest, func, seen)
+    # y0 and t go in as the float64 arrays odeint integrates, so [1, 0] and
+    # [1.0, 0.0] share entries, while args reach the model as they are
+    for array in (y0, t):
+        try:
+            array = np.asarray(array, dtype=np.float64)
+        except (TypeError, ValueError) as error:
+            raise UnhashableModel(f"cannot hash {array!r} as an array") from error
+        _hash_value(digest, array, seen)
+    _hash_value(digest, args, seen)
+    return digest.hexdigest()
+
+
+def evict(cache_dir: Path = CACHE_DIR, max_bytes: int = MAX_BYTES):
+    entries = []
+    for path in cache_dir.glob("*.npy"):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        # another process may have evicted it already, mapped copies stay valid
+        path.unlink(missing_ok=True)
+        total -= size
+
+
+def cached_odeint(
+    func: Callable,
+    y0,
+    t,
+    args: tuple = (),
+    cache_dir: Path = CACHE_DIR,
+    max_bytes: int = MAX_BYTES,
+) -> np.ndarray:
+    # results are read-only either way, hits are memory-mapped from the cache
+    try:
+        path = cache_dir / f"{cache_key(func, y0, t, args)}.npy"
+    except UnhashableModel:
+        solution = odeint(func, y0, t, args=args)
+        solution.flags.writeable = False
+        return solution
+
+    try:
+        solution = np.load(path, mmap_mode="r")
+    except (FileNotFoundError, ValueError):
+        pass
+    else:
+        # mtime is the recency used by evict
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        return solution
+
+    solution = odeint(func, y0, t, args=args)
+
+    atomic_write(path, lambda file: np.save(file, solution))
+
+    # scanning the directory is linear in its size, so only do it once the
+    # process has written a sizeable fraction of the budget
+    global _unchecked_bytes
+    if _unchecked_bytes is None or _unchecked_bytes >= max_bytes // 16:
+        evict(cache_dir, max_bytes)
+        _unchecked_bytes = 0
+    _unchecked_bytes += solution.nbytes
+
+    solution.flags.writeable = False
+    return solution
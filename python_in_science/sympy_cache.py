@@ -0,0 +1,40 @@
+import hashlib
+import pickle
+from pathlib import Path
+
+import sympy as sp
+
+from python_in_science.cache import CACHE_ROOT, atomic_write
+
+CACHE_DIR = CACHE_ROOT / "sympy"
+
+
+def cache_key(eq: sp.Eq, func: sp.Function, ics: dict | None) -> str:
+    # srepr includes symbol assumptions, so positive=True and a plain symbol
+    # give different keys, as they may give different solutions
+    ics = sorted(ics.items(), key=sp.srepr) if ics else None
+    digest = hashlib.sha256()
+    digest.update(sp.__version__.encode())
+    digest.update(sp.srepr((eq, func, ics)).encode())
+    return digest.hexdigest()
+
+
+def cached_dsolve(
+    eq: sp.Eq,
+    func: sp.Function,
+    ics: dict | None = None,
+    cache_dir: Path = CACHE_DIR,
+) -> sp.Eq:
+    path = cache_dir / f"{cache_key(eq, func, ics)}.pickle"
+
+    try:
+        with open(path, "rb") as file:
+            return pickle.load(file)
+    except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+        pass
+
+    sol = sp.dsolve(eq, func, ics=ics)
+
+    atomic_write(path, lambda file: pickle.dump(sol, file))
+
+    return sol
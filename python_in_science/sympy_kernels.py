@@ -0,0 +1,93 @@
+import numba
+import numpy as np
+import sympy as sp
+from sympy.printing.numpy import NumPyPrinter
+
+
+def numba_kernel(
+    expr: sp.Expr,
+    t: sp.Symbol,
+    params: tuple[sp.Symbol, ...],
+    complex_eval: bool = False,
+):
+    if not params:
+        raise ValueError("numba_kernel needs at least one parameter")
+
+    printer = NumPyPrinter()
+
+    unknown = expr.free_symbols - {t, *params}
+    if unknown:
+        raise ValueError(f"symbols without a value: {sorted(map(str, unknown))}")
+
+    # generated locals start with an underscore and printed functions are
+    # qualified with numpy, so symbols must not use either
+    for symbol in (t, *params):
+        name = printer.doprint(symbol)
+        if name.startswith("_") or name in ("numpy", "numba"):
+            raise ValueError(f"symbol name {name!r} clashes with generated code")
+
+    # common subexpressions are computed once, and those independent of t are
+    # hoisted out of the loop over time points, so e.g. sqrt(gamma**2 - omega0**2)
+    # is evaluated once per parameter set instead of once per array element
+    replacements, [reduced] = sp.cse(expr, symbols=sp.numbered_symbols("_x"))
+
+    inner = {t}
+    outer_lines, inner_lines = [], []
+    for symbol, value in replacements:
+        if value.free_symbols & inner:
+            inner.add(symbol)
+            inner_lines.append((symbol, value))
+        else:
+            outer_lines.append((symbol, value))
+
+    names = [f"_p{idx}" for idx in range(len(params))]
+    # for expressions real only in total, such as sqrt(gamma**2 - omega0**2) of
+    # an underdamped oscillator
+    cast = "complex" if complex_eval else "float"
+    result = printer.doprint(reduced)
+    if complex_eval:
+        result = f"({result}).real"
+
+    source = [
+        f"def kernel(_time, {', '.join(names)}):",
+        f"    _out = numpy.empty(({names[0]}.shape[0], _time.shape[0]))",
+        f"    for _i in numba.prange({names[0]}.shape[0]):",
+        *(
+            f"        {printer.doprint(param)} = {cast}({name}[_i])"
+            for param, name in zip(params, names)
+        ),
+        *(
+            f"        {symbol} = {printer.doprint(value)}"
+            for symbol, value in outer_lines
+        ),
+        "        for _j in range(_time.shape[0]):",
+        f"            {printer.doprint(t)} = {cast}(_time[_j])",
+        *(
+            f"            {symbol} = {printer.doprint(value)}"
+            for symbol, value in inner_lines
+        ),
+        f"            _out[_i, _j] = {result}",
+        "    return _out",
+    ]
+
+    namespace = {"numpy": np, "numba": numba}
+    exec("\n".join(source), namespace)
+    compiled = numba.njit(parallel=True)(namespace["kernel"])
+
+    # the compiled loop indexes every parameter array by the length of the
+    # first one without bounds checks, so a shorter array would be read past
+    # its end rather than raise
+    def kernel(time, *values):
+        if len(values) != len(params):
+            raise ValueError(f"expected {len(params)} parameter arrays")
+        time = np.asarray(time)
+        values = [np.asarray(value) for value in values]
+        if time.ndim != 1:
+            raise ValueError("time points must be a 1-D array")
+        if any(value.ndim != 1 for value in values):
+            raise ValueError("parameter values must be 1-D arrays")
+        if len({value.shape[0] for value in values}) != 1:
+            raise ValueError("parameter arrays must have the same length")
+        return compiled(time, *values)
+
+    return kernel